@@ -1,7 +1,12 @@
 import ast
 import collections
+import contextlib
+import functools
+import getpass
 import glob
 import itertools
+import os
+import shutil
 from pathlib import Path
 import pickle
 import re
@@ -16,6 +21,59 @@ from . import ltemanager, notation, sdds, std_print_enabled, util
 
 UNAVAILABLE_BLOCK_OPTS = collections.defaultdict(list)
 
+FAST_LOGS = os.environ.get("PYELEGANT_FAST_LOGS", "0") == "1"
+# ^ When set to "1", the optimizer logging options in
+#   "(parallel_)optimization_setup" blocks are overridden with low-I/O
+#   settings. On a networked filesystem, frequent simplex/population log
+#   writes can dominate the wall-clock time of an optimization run.
+
+FAST_LOG_OPT_OVERRIDES = dict(
+    simplex_log_interval=1000,
+    output_sparsing_factor=1000,
+    simplex_log="/dev/null",
+    population_log="/dev/null",
+)
+
+# ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=1024)
+def _fmt_double(value: float, spec: str) -> str:
+    """
+    Memoized float formatting. The same handful of values (limits, step
+    sizes, tolerances, etc.) tend to recur many times while building an ELE
+    file, and formatting a float in CPython is relatively expensive, so the
+    cache hit rate is high.
+    """
+
+    return format(value, spec)
+
+
+# ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=256)
+def rpn(*tokens) -> str:
+    """
+    Join RPN tokens into a canonical, single-space-separated expression
+    string, e.g.,
+        rpn("MID#1.X", "sqr", "MID#1.Z", "sqr", "+", "sqrt")
+    This normalizes accidental whitespace differences between otherwise
+    identical expressions, and memoization lets expressions repeated across
+    blocks (or across successive builds within the same process) share a
+    single string object.
+    """
+
+    return " ".join([str(token) for token in tokens])
+
+
+# ----------------------------------------------------------------------
+def deg2rad(deg, spec=".17g"):
+    """
+    Format an angle in degrees as a radian literal for use in emitted RPN
+    expressions, e.g., deg2rad(6) -> "0.10471975511965977". Inlining the
+    constant removes the "dtor" conversion that elegant's RPN VM would
+    otherwise re-execute at every evaluation of the expression.
+    """
+
+    return format(np.deg2rad(deg), spec)
+
 # ----------------------------------------------------------------------
 def set_unavailable_block_options(block_name, option_name):
     """"""
@@ -64,6 +122,7 @@ class EleBlocks:
         self._parse_parallel_optimization_setup()
         self._parse_optimization_term()
         self._parse_optimization_variable()
+        self._parse_rpn_expression()
         self._parse_rpn_load()
         self._parse_run_control()
         self._parse_run_setup()
@@ -82,6 +141,23 @@ class EleBlocks:
 
         self._update_output_filepaths()
 
+        self._build_keyword_lookup()
+
+    # ----------------------------------------------------------------------
+    def _build_keyword_lookup(self):
+        """
+        Precompute, for each block, a dict mapping each keyword to its
+        (dtype, array_size), so that per-call keyword validation and
+        dispatch become dict lookups instead of linear tuple searches.
+        """
+
+        self.keyword_lookup = {}
+        for block_header, entries in self.info.items():
+            self.keyword_lookup[block_header] = {
+                key: (dtype, array_size)
+                for key, dtype, _default, _recommended, array_size in entries
+            }
+
     # ----------------------------------------------------------------------
     def _parse_block_def(self, block_def_str):
         """"""
@@ -742,6 +818,19 @@ class EleBlocks:
         """
         )
 
+    # ----------------------------------------------------------------------
+    def _parse_rpn_expression(self):
+        """"""
+
+        # Elegant Manual Section 7.49
+        self._parse_block_def(
+            """
+        &rpn_expression
+            STRING expression = NULL;
+        &end
+        """
+        )
+
     # ----------------------------------------------------------------------
     def _parse_rpn_load(self):
         """"""
@@ -2223,9 +2312,11 @@ class BookmarkableList:
     def __iter__(self):
         """"""
 
-        return iter(self._list[:-1])
+        return itertools.islice(self._list, len(self._list) - 1)
         # ^ Last element is excluded, as it is the "bottom"
         #   BookmarkableObject, which contains no meaningful data.
+        #   islice avoids allocating a sliced copy of the list on every
+        #   iteration.
 
     # ----------------------------------------------------------------------
     def _assert_no_duplicate_bookmarks(self, bookmark_key):
@@ -2455,11 +2546,19 @@ class EleDesigner:
         double_format: str = ".12g",
         auto_print_on_add=True,
         adj_optim_var_limits_to_init=False,
+        dedup_optim_terms=True,
     ):
         """Constructor"""
 
         self._adj_optim_var_limits_to_init = adj_optim_var_limits_to_init
 
+        self._dedup_optim_terms = dedup_optim_terms
+        # ^ If True, an "optimization_term" block whose (term, weight) pair
+        #   is identical (up to whitespace) to an already added one is
+        #   skipped with a printed notice. Every term is evaluated by
+        #   elegant at every trial point, so accidental duplicates
+        #   (typically copy/paste) cost real optimization time.
+
         if ele_filepath:
             self.ele_filepath = str(Path(ele_filepath).absolute())
             if ele_folderpath:
@@ -2499,12 +2598,16 @@ class EleDesigner:
         self._text_blocks = BookmarkableList()
 
         self._text = ""
+        self._text_is_stale = False
         self._last_block_text = ""
 
         self.rootname = None
         self.output_filepath_list = []
         self.actual_output_filepath_list = []
 
+        self._tmpfs_log_dirpath = None
+        self._redirected_log_filepaths = []
+
         self.clear()
 
         self.double_format = double_format
@@ -2519,7 +2622,10 @@ class EleDesigner:
 
         self._text_blocks.clear()
 
+        self._optim_term_keys = set()
+
         self._text = ""
+        self._text_is_stale = False
         self._last_block_text = ""
 
         self.rootname = None
@@ -2539,7 +2645,11 @@ class EleDesigner:
     def _update_text(self):
         """"""
 
+        if not self._text_is_stale:
+            return
+
         self._text = "".join([b_obj.get_object() for b_obj in self._text_blocks])
+        self._text_is_stale = False
 
     # ----------------------------------------------------------------------
     def print_whole(self):
@@ -2566,10 +2676,105 @@ class EleDesigner:
 
         self._update_text()
 
+        if self._tmpfs_log_dirpath is not None:
+            text = self._redirect_log_paths(self._text)
+        else:
+            text = self._text
+
         util.robust_text_file_write(
-            self.ele_filepath, self._text, nMaxTry=nMaxTry, sleep=sleep
+            self.ele_filepath, text, nMaxTry=nMaxTry, sleep=sleep
         )
 
+    # ----------------------------------------------------------------------
+    def redirect_logs_to_tmpfs(self, tmpfs_dirpath=None):
+        """
+        Have write() rewrite the optimizer log-file options (log_file,
+        term_log_file, population_log, simplex_log) in the generated ELE
+        text so that the logs are written under "tmpfs_dirpath" (default:
+        /dev/shm/{username}) instead of the working directory. On a
+        networked filesystem, these frequently-appended logs can dominate
+        the wall-clock time of an optimization run.
+
+        Note that tmpfs is local to the node elegant runs on; use
+        collect_tmpfs_logs() after a local run to copy the logs back, or
+        leave this feature off when the logs must be visible across nodes.
+        """
+
+        if tmpfs_dirpath is None:
+            tmpfs_dirpath = os.path.join("/dev/shm", getpass.getuser())
+
+        self._tmpfs_log_dirpath = str(tmpfs_dirpath)
+
+    # ----------------------------------------------------------------------
+    def _redirect_log_paths(self, text):
+        """"""
+
+        if self.rootname is not None:
+            rootname = self.rootname
+        else:
+            assert self.ele_filepath.endswith(".ele")
+            rootname = self.ele_filepath[:-4]
+        root_base = Path(rootname).name
+
+        tmpfs = self._tmpfs_log_dirpath
+        Path(tmpfs).mkdir(parents=True, exist_ok=True)
+
+        self._redirected_log_filepaths.clear()
+
+        def _sub(matched):
+            indent, key, eq, orig_val = matched.groups()
+            if orig_val.startswith("/dev/"):
+                return matched.group(0)  # e.g., /dev/null or /dev/tty
+            final_name = Path(orig_val.replace("%s", root_base)).name
+            new_val = os.path.join(tmpfs, final_name)
+            self._redirected_log_filepaths.append(new_val)
+            return f'{indent}{key}{eq}"{new_val}"'
+
+        return re.sub(
+            r'(?m)^(\s*)(term_log_file|population_log|simplex_log|log_file)'
+            r'( = )"([^"]*)"',
+            _sub,
+            text,
+        )
+
+    # ----------------------------------------------------------------------
+    def collect_tmpfs_logs(self, dest_dirpath=None):
+        """
+        Copy the log files redirected to tmpfs by the last write() back
+        next to the ELE file (or into "dest_dirpath"). Only meaningful
+        after a local run, since tmpfs is node-local.
+        """
+
+        if dest_dirpath is None:
+            dest_dirpath = Path(self.ele_filepath).parent
+
+        for fp in self._redirected_log_filepaths:
+            try:
+                shutil.copy2(fp, dest_dirpath)
+            except OSError:
+                print(f'Failed to copy "{fp}" back to "{dest_dirpath}"')
+
+    # ----------------------------------------------------------------------
+    def write_run_script(self, script_filepath, mpi_ranks, bind="core"):
+        """
+        Write a shell launcher that runs Pelegant on this ELE file with
+        the MPI ranks pinned to cores. Without pinning, the kernel
+        scheduler is free to migrate ranks between cores mid-run, which
+        repeatedly invalidates their caches while every rank is tracing
+        the same lattice. Choose "mpi_ranks" to match the optimizer's
+        concurrency (e.g., population_size + 1 for hybrid simplex).
+        """
+
+        contents = (
+            "#!/bin/sh\n"
+            f"mpiexec --bind-to {bind} --map-by {bind} "
+            f"-n {mpi_ranks:d} Pelegant {self.ele_filepath}\n"
+        )
+
+        util.robust_text_file_write(script_filepath, contents)
+
+        Path(script_filepath).chmod(0o755)
+
     # ----------------------------------------------------------------------
     def get_bookmark(self):
         """"""
@@ -2657,6 +2862,7 @@ class EleDesigner:
         self._last_block_text = "\n"
 
         self._text_blocks.insert(self._last_block_text)
+        self._text_is_stale = True
         for v in self.rpnvars.values():
             v.update_base([])
 
@@ -2670,12 +2876,30 @@ class EleDesigner:
         self._last_block_text = f"! {comment}\n"
 
         self._text_blocks.insert(self._last_block_text)
+        self._text_is_stale = True
         for v in self.rpnvars.values():
             v.update_base([])
 
         if std_print_enabled["out"] and self.auto_print_on_add:
             self.print_last_block()
 
+    # ----------------------------------------------------------------------
+    @contextlib.contextmanager
+    def section(self, header=None):
+        """
+        Context manager that groups a run of related blocks: emits a header
+        comment (if given) on entry and a single trailing blank line on
+        exit, replacing the add_comment()/add_newline() pairs that would
+        otherwise bracket each group.
+        """
+
+        if header is not None:
+            self.add_comment(header)
+
+        yield self
+
+        self.add_newline()
+
     # ----------------------------------------------------------------------
     def _should_be_inline_block(self, block_body_line_list):
         """"""
@@ -2701,16 +2925,16 @@ class EleDesigner:
 
             raise ValueError(f'Unexpected block name "{block_header}".')
 
-        keywords, dtypes, default_vals, recommended, array_sizes = zip(
-            *self.blocks.info[block_header]
-        )
+        kw_lookup = self.blocks.keyword_lookup[block_header]
+
+        double_spec = self.double_format.replace("%", "")
 
         block = []
         for k, v in kwargs.items():
 
-            if k not in keywords:
+            if k not in kw_lookup:
                 print(f'* Valid keys for Block "{block_header}" are the following:')
-                print("\n".join(sorted(keywords)))
+                print("\n".join(sorted(kw_lookup)))
 
                 raise ValueError(f'Unexpected key "{k}" for Block "{block_header}"')
 
@@ -2722,11 +2946,11 @@ class EleDesigner:
                 )
                 continue
 
-            i = keywords.index(k)
+            dtype, array_size = kw_lookup[k]
 
-            is_scalar = array_sizes[i] == 0
+            is_scalar = array_size == 0
 
-            if dtypes[i] == "STRING":
+            if dtype == "STRING":
                 if v is None:
                     continue
                 elif (
@@ -2755,31 +2979,25 @@ class EleDesigner:
                             )
                         )
 
-            elif dtypes[i] == "long":
+            elif dtype == "long":
                 block.append(f"{k} = {v:d}")
-            elif dtypes[i] == "double":
+            elif dtype == "double":
                 if is_scalar:
                     try:
-                        block.append(
-                            (
-                                "{k} = {v:%s}" % self.double_format.replace("%", "")
-                            ).format(k=k, v=v)
-                        )
+                        block.append(f"{k} = {_fmt_double(float(v), double_spec)}")
                     except ValueError:
                         if v.startswith("<") and v.endswith(">"):  # macro definition
                             block.append(f"{k} = {v}")
                         else:
                             raise
                 else:
-                    max_array_size = array_sizes[i]
+                    max_array_size = array_size
                     for array_index, scalar_val in v.items():
                         assert 0 <= array_index < max_array_size
                         try:
                             block.append(
-                                (
-                                    "{k}[{array_index:d}] = {v:%s}"
-                                    % self.double_format.replace("%", "")
-                                ).format(k=k, v=v[array_index], array_index=array_index)
+                                f"{k}[{array_index:d}] = "
+                                f"{_fmt_double(float(v[array_index]), double_spec)}"
                             )
                         except ValueError:
                             v_str = v[array_index]
@@ -2791,7 +3009,7 @@ class EleDesigner:
                                 raise
 
             else:
-                raise ValueError("Unexpected data type: {}".format(dtypes[i]))
+                raise ValueError("Unexpected data type: {}".format(dtype))
 
         # Check whether initial value is within specified limits
         if (block_header == "optimization_variable") and (
@@ -2940,6 +3158,13 @@ class EleDesigner:
                     # print(f'** Adding new variable "{terms[i+1]}"')
                     new_var_names["optimization_term"].append(terms[i + 1])
 
+        elif block_header == "rpn_expression":
+            terms = kwargs["expression"].split()
+
+            for i, t in enumerate(terms):
+                if t == "sto":
+                    new_var_names["optimization_term"].append(terms[i + 1])
+
         elif block_header in ("optimization_variable", "optimization_covariable"):
             name, item = kwargs["name"].upper(), kwargs["item"].upper()
             new_var_names["optimization_term"].extend(
@@ -3426,21 +3651,255 @@ class EleDesigner:
     def add_block(self, block_name, **kwargs):
         """"""
 
+        if (
+            self._dedup_optim_terms
+            and (block_name == "optimization_term")
+            and ("term" in kwargs)
+        ):
+            term = kwargs["term"]
+            if isinstance(term, InfixEquation):
+                term_str = term.torpn()
+            else:  # Either "str" or "OptimizationTerm" object
+                term_str = str(term)
+            key = (" ".join(term_str.split()), kwargs.get("weight", 1.0))
+            if key in self._optim_term_keys:
+                print(f'* Skipping duplicate "optimization_term" block: "{key[0]}"')
+                return
+            self._optim_term_keys.add(key)
+
+        if block_name == "parallel_optimization_setup":
+            auto_interval = kwargs.pop("auto_comparison_interval", False)
+            if auto_interval and ("hybrid_simplex_comparison_interval" not in kwargs):
+                n_evaluations = kwargs.get("n_evaluations")
+                population_size = kwargs.get("population_size")
+                if (n_evaluations is None) or (population_size is None):
+                    raise ValueError(
+                        '"auto_comparison_interval" requires both '
+                        '"n_evaluations" and "population_size" to be specified'
+                    )
+                # Each comparison is a global rank synchronization; with a
+                # larger concurrently-evaluated population, fewer of them
+                # are needed over the same evaluation budget.
+                kwargs["hybrid_simplex_comparison_interval"] = max(
+                    50, n_evaluations // (2 * population_size)
+                )
+
+        if FAST_LOGS and (
+            block_name in ("optimization_setup", "parallel_optimization_setup")
+        ):
+            for k, v in FAST_LOG_OPT_OVERRIDES.items():
+                if (k in kwargs) and (kwargs[k] != v):
+                    print(f'* "PYELEGANT_FAST_LOGS" is set: overriding "{k}" to {v!r}')
+                    kwargs[k] = v
+
         self._last_block_text = self._get_block_str(block_name, **kwargs)
 
         # --- Now update "rpnvars" ---
         self._update_base_rpnvars(block_name, **kwargs)
 
         self._text_blocks.insert(self._last_block_text)
+        self._text_is_stale = True
+
+        if std_print_enabled["out"] and self.auto_print_on_add:
+            self.print_last_block()
+
+    # ----------------------------------------------------------------------
+    def add_optimization_variables_bulk(
+        self, rows, *, item=None, lower_limit=None, upper_limit=None, step_size=None
+    ):
+        """
+        Add one "&optimization_variable" block for each row in "rows" in a
+        single pass.
+
+        Each row is a tuple (name, item, lower_limit, upper_limit, step_size).
+        Trailing elements may be omitted from a row, in which case the
+        corresponding keyword arguments are used as shared values.
+
+        The emitted text is identical to that of the equivalent sequence of
+        add_block("optimization_variable", ...) calls, but the format spec
+        and block template are built only once and shared across all rows,
+        which cuts the per-variable Python overhead when declaring many
+        near-identical variables.
+        """
+
+        shared = (item, lower_limit, upper_limit, step_size)
+
+        norm_rows = []
+        for row in rows:
+            full_row = tuple(row) + shared[len(row) - 1 :]
+            if (len(full_row) != 5) or any(v is None for v in full_row):
+                raise ValueError(
+                    "Each row must provide (name, item, lower_limit, "
+                    "upper_limit, step_size), either directly or via the "
+                    "shared keyword arguments."
+                )
+            norm_rows.append(list(full_row))
+
+        # Same initial-value check as the one add_block() performs for an
+        # individual "optimization_variable" block.
+        for row in norm_rows:
+            name, _item, lo, hi, _ = row
+            if lo == hi:
+                continue  # Parameter range is unlimited.
+            init_val = self.get_LTE_elem_prop(name, _item)
+            if not init_val:
+                print(
+                    f"{name}.{_item} is not defined in LTE. So, initial value check is skipped."
+                )
+                continue
+            if init_val < lo:
+                if self._adj_optim_var_limits_to_init:
+                    row[2] = init_val
+                elif f"{init_val:{self.double_format}}" != f"{lo:{self.double_format}}":
+                    raise ValueError(
+                        (
+                            f"Initial value ({init_val:{self.double_format}}) cannot be "
+                            f'smaller than "lower_limit" ({lo:{self.double_format}})'
+                        )
+                    )
+            elif init_val > hi:
+                if self._adj_optim_var_limits_to_init:
+                    row[3] = init_val
+                elif f"{init_val:{self.double_format}}" != f"{hi:{self.double_format}}":
+                    raise ValueError(
+                        (
+                            f"Initial value ({init_val:{self.double_format}}) cannot be "
+                            f'larger than "upper_limit" ({hi:{self.double_format}})'
+                        )
+                    )
+
+        spec = self.double_format.replace("%", "")
+
+        shared_tail = norm_rows[0][1:] if norm_rows else None
+        if shared_tail and all(row[1:] == shared_tail for row in norm_rows):
+            # All rows share everything but the name (the common case for
+            # grouped declarations): format the numeric fields only once
+            # and substitute just the name per block.
+            _item, lo, hi, st = shared_tail
+            tail = (
+                f'    item = "{_item}"\n'
+                f"    lower_limit = {_fmt_double(float(lo), spec)}\n"
+                f"    upper_limit = {_fmt_double(float(hi), spec)}\n"
+                f"    step_size = {_fmt_double(float(st), spec)}\n"
+                "&end\n"
+            )
+            self._last_block_text = "".join(
+                [
+                    f'&optimization_variable\n    name = "{row[0]}"\n{tail}'
+                    for row in norm_rows
+                ]
+            )
+        else:
+            # A printf-style template keeps the whole per-row emission
+            # (including the float formatting) inside the interpreter's
+            # C-level "%" operator.
+            template = (
+                "&optimization_variable\n"
+                '    name = "%s"\n'
+                '    item = "%s"\n'
+                f"    lower_limit = %{spec}\n"
+                f"    upper_limit = %{spec}\n"
+                f"    step_size = %{spec}\n"
+                "&end\n"
+            )
+            self._last_block_text = "".join(
+                [template % tuple(row) for row in norm_rows]
+            )
+
+        # --- Now update "rpnvars" ---
+        new_var_names = []
+        for name, _item, *_ in norm_rows:
+            name, _item = name.upper(), _item.upper()
+            new_var_names.extend([f"{name}.{_item}", f"{name}.{_item}0"])
+
+        self._text_blocks.insert(self._last_block_text)
+        self._text_is_stale = True
+        self.rpnvars["optimization_term"].update_base(new_var_names)
+        self.rpnvars["optimization_covariable"].update_base(new_var_names)
 
         if std_print_enabled["out"] and self.auto_print_on_add:
             self.print_last_block()
 
+    # ----------------------------------------------------------------------
+    def add_optimization_variables_same(
+        self, names, *, item, lower_limit, upper_limit, step_size
+    ):
+        """
+        Add one "&optimization_variable" block per name in "names", with
+        all other fields shared, e.g.,
+            add_optimization_variables_same(
+                ["QF1", "QF2"], item="K1",
+                lower_limit=-25, upper_limit=25, step_size=1e-4)
+        The shared numeric fields are formatted only once; each emitted
+        block then just substitutes the name.
+        """
+
+        self.add_optimization_variables_bulk(
+            [(name,) for name in names],
+            item=item,
+            lower_limit=lower_limit,
+            upper_limit=upper_limit,
+            step_size=step_size,
+        )
+
+    # ----------------------------------------------------------------------
+    def add_optimization_variables_from_array(self, arr):
+        """
+        Structured-array front end for add_optimization_variables_bulk().
+
+        "arr" is a NumPy structured array whose first five fields are
+        (name, item, lower_limit, upper_limit, step_size), e.g.,
+            np.array(
+                [("B1QDH", "ANGLE", -0.01, 0.03, 1e-5), ...],
+                dtype=[("name", "U16"), ("item", "U8"),
+                       ("lo", "f8"), ("hi", "f8"), ("step", "f8")])
+        This keeps a long variable list as one compact record array and
+        emits the whole group in a single pass.
+        """
+
+        self.add_optimization_variables_bulk([tuple(row)[:5] for row in arr])
+
+    # ----------------------------------------------------------------------
+    def warm_start_from(self, prev_run_prefix):
+        """
+        Emit a "&load_parameters" block that restarts the optimization from
+        the final parameter values of a previous run, identified by its
+        rootname prefix (i.e., the ELE file path without the ".ele"
+        extension). On incremental re-runs this typically saves most of
+        the evaluations that would otherwise be spent re-discovering the
+        previous optimum.
+        """
+
+        param_filepath = f"{prev_run_prefix}.param"
+        if not Path(param_filepath).exists():
+            raise FileNotFoundError(
+                f'Previous run parameter file "{param_filepath}" does not exist.'
+            )
+
+        self.add_block(
+            "load_parameters", filename=param_filepath, change_defined_values=1
+        )
+
+    # ----------------------------------------------------------------------
+    def add_rpn_scalar(self, var_name, expression):
+        """
+        Emit an "&rpn_expression" block that evaluates "expression" once at
+        parse time and stores the result in the RPN variable "var_name".
+
+        Useful for hoisting subexpressions that stay constant throughout an
+        optimization (e.g., a reference floor-coordinate radius derived
+        from rpn_load data) out of optimization terms, which elegant
+        re-evaluates at every trial point.
+        """
+
+        self.add_block("rpn_expression", expression=f"{expression} sto {var_name}")
+
     # ----------------------------------------------------------------------
     def remove_block_above(self):
         """"""
 
         self._text_blocks.pop_above()
+        self._text_is_stale = True
 
         for v in self.rpnvars.values():
             v.pop_above()
@@ -3451,6 +3910,7 @@ class EleDesigner:
         """"""
 
         self._text_blocks.pop_below()
+        self._text_is_stale = True
 
         for v in self.rpnvars.values():
             v.pop_below()
@@ -2432,7 +2432,7 @@ class NSLS2(AbstractFacility):
 
         # Create default error spec if not provided
         if self.error_spec is None:
-            self.error_spec = error_specs.NSLS2ErrorSpecModel()
+            self.error_spec = error_specs.default_nsls2_spec()
 
         # "fsdb" stands for "(f)acility-(s)pecific (d)ata(b)ase"
         self.fsdb = ltemanager.NSLS2(self.err.indiv_LTE, lattice_type=self.lattice_type)
@@ -2706,7 +2706,7 @@ class NSLS2U(AbstractFacility):
     ):
         # Create default error spec if not provided
         if error_spec is None:
-            error_spec = error_specs.NSLS2UErrorSpecModel()
+            error_spec = error_specs.default_nsls2u_spec()
 
         super().__init__(
             design_LTE,
@@ -3035,7 +3035,7 @@ class NSLS2CB(AbstractFacility):
     ):
         # Create default error spec if not provided
         if error_spec is None:
-            error_spec = error_specs.NSLS2CBErrorSpecModel()
+            error_spec = error_specs.default_nsls2cb_spec()
 
         super().__init__(
             design_LTE,
@@ -3332,11 +3332,12 @@ class NSLS2CB(AbstractFacility):
         for mag_type, mp_err_spec in mp_err_specs.items():
             magnet_spec = self.error_spec.quads_sexts[mag_type]
 
-            # Determine n_main_poles and main_normal from magnet type
-            if isinstance(magnet_spec, error_specs.QuadErrorSpecModel):
+            # Determine n_main_poles and main_normal from the spec's
+            # discriminator tag
+            if magnet_spec.magnet_type == "quad":
                 n_main_poles = 4
                 main_normal = True
-            elif isinstance(magnet_spec, error_specs.SextErrorSpecModel):
+            elif magnet_spec.magnet_type == "sext":
                 n_main_poles = 6
                 main_normal = True
             else:
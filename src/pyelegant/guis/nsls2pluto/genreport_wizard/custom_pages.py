@@ -1,9 +1,10 @@
 from copy import deepcopy
 import datetime
 import errno
-from functools import partial
+from functools import lru_cache, partial
 import getpass
 import hashlib
+import io
 import os
 from pathlib import Path
 import pty
@@ -21,7 +22,6 @@ from qtpy import QtCore, QtGui, QtWidgets, uic
 
 Qt = QtCore.Qt
 
-import matplotlib.pyplot as plt
 import numpy as np
 from ruamel import yaml
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
@@ -33,6 +33,33 @@ from pyelegant.scripts.common import genreport
 
 TEST_MODE = False
 
+# Pre-bound float formatter: reuses the parsed ".6g" spec across the many
+# widget <-> config value conversions instead of reparsing it per f-string.
+_fmt6g = "{:.6g}".format
+
+
+@lru_cache(maxsize=None)
+def _get_cached_ui_class(ui_filename):
+    """
+    Return the generated form class for a ``.ui`` file in this folder.
+
+    ``uic.loadUi()`` re-parses the XML and regenerates the form code every
+    time a dialog is opened; ``uic.loadUiType()`` does that work once per
+    file and the cache makes every later open a plain class instantiation.
+    """
+    ui_file = os.path.join(os.path.dirname(__file__), ui_filename)
+    form_class, _ = uic.loadUiType(ui_file)
+    return form_class
+
+
+def _setup_cached_ui(widget, ui_filename):
+    """Drop-in replacement for ``uic.loadUi()`` using the cached form class."""
+    ui = _get_cached_ui_class(ui_filename)()
+    ui.setupUi(widget)
+    # loadUi() used to bind the child widgets directly onto the widget
+    for name, child in vars(ui).items():
+        setattr(widget, name, child)
+
 
 def get_slurm_partitions():
     cmd = "scontrol show partition"
@@ -238,39 +265,30 @@ def duplicate_yaml_conf(orig_conf):
     """"""
 
     # Here, you cannot use "deepcopy()" and "pe.util.deepcopy_dict(orig_conf)".
-    # Instead, you must dump to a temp file and load it back in order
-    # to retain the anchors/references.
-
-    _temp_yaml_file = tempfile.NamedTemporaryFile(suffix=".yaml", dir=None, delete=True)
+    # Instead, you must dump and load back the YAML text in order to
+    # retain the anchors/references. The round trip stays in memory; a
+    # temp file on disk would only add I/O to every duplication.
 
     yml = yaml.YAML()
     yml.preserve_quotes = True
     yml.width = 70
     yml.boolean_representation = ["False", "True"]
 
-    with open(_temp_yaml_file.name, "w") as f:
-        yml.dump(orig_conf, f)
-
-    dup_conf = yml.load(Path(_temp_yaml_file.name).read_text())
+    buf = io.StringIO()
+    yml.dump(orig_conf, buf)
 
-    _temp_yaml_file.close()
-
-    return dup_conf
+    return yml.load(buf.getvalue())
 
 
 def get_yaml_repr_str(yaml_commented_obj):
     """"""
 
-    _temp_yaml_file = tempfile.NamedTemporaryFile(suffix=".yaml", dir=None, delete=True)
-
     yml = yaml.YAML()
-    yml.dump(yaml_commented_obj, _temp_yaml_file)
-
-    repr = Path(_temp_yaml_file.name).read_text().splitlines()[0]
 
-    _temp_yaml_file.close()
+    buf = io.StringIO()
+    yml.dump(yaml_commented_obj, buf)
 
-    return repr
+    return buf.getvalue().splitlines()[0]
 
 
 def convert_to_ScalarFloat(float_val):
@@ -822,6 +840,55 @@ class PageStandard(QtWidgets.QWizardPage):
         self.initializePage()
 
 
+# Static per-page data shared by every PageGenReport instance: the wizard
+# instantiates many pages per window, so the calc-type list and the
+# stateless converter entries are built once at import and cloned per page.
+_ALL_CALC_TYPES = (
+    "xy_aper",
+    "fmap_xy",
+    "fmap_px",
+    "cmap_xy",
+    "cmap_px",
+    "tswa",
+    "nonlin_chrom",
+    "mom_aper",
+)
+
+_YAML_OBJ = yaml.YAML()
+
+_STATIC_CONVERTERS = {
+    "spin": dict(set=lambda v: v, get=lambda v: v),
+    "edit_float": dict(
+        # set = lambda v: f'{v:.6g}',
+        set=lambda v: get_yaml_repr_str(v),
+        # get = lambda v: float(v)),
+        get=lambda v: _YAML_OBJ.load(
+            (v if ("." in v) or ("e" in v) or ("E" in v) else v + ".0")
+        ),
+    ),
+    "edit_%": dict(
+        set=lambda v: _fmt6g(v * 1e2),
+        # get = lambda v: float(v) * 1e-2,
+        get=lambda v: _YAML_OBJ.load(v + "e-2" if float(v) != 0.0 else "0.0"),
+    ),
+    "edit_str": dict(set=lambda v: str(v), get=lambda v: v),
+    "edit_str_None": dict(
+        set=lambda v: str(v) if v is not None else "",
+        get=lambda v: v if v.strip() != "" else None,
+    ),
+    "check": dict(set=lambda v: v, get=lambda v: v),
+    "combo": dict(set=lambda v: v, get=lambda v: v),
+    "edit_list_int": dict(
+        set=lambda v_list: ", ".join([f"{v:d}" for v in v_list]),
+        get=lambda v: [int(s) for s in v.split(",")],
+    ),
+    "edit_list_float": dict(
+        set=lambda v_list: ", ".join([_fmt6g(v) for v in v_list]),
+        get=lambda v: [float(s.strip()) for s in v.split(",")],
+    ),
+}
+
+
 class PageGenReport(PageStandard):
     """"""
 
@@ -832,56 +899,17 @@ class PageGenReport(PageStandard):
 
         self._connections_established = False
 
-        self.all_calc_types = [
-            "xy_aper",
-            "fmap_xy",
-            "fmap_px",
-            "cmap_xy",
-            "cmap_px",
-            "tswa",
-            "nonlin_chrom",
-            "mom_aper",
-        ]
+        self.all_calc_types = list(_ALL_CALC_TYPES)
 
-        YAML_OBJ = yaml.YAML()
-
-        self.converters = {
-            "spin": dict(set=lambda v: v, get=lambda v: v),
-            "edit_float": dict(
-                # set = lambda v: f'{v:.6g}',
-                set=lambda v: get_yaml_repr_str(v),
-                # get = lambda v: float(v)),
-                get=lambda v: YAML_OBJ.load(
-                    (v if ("." in v) or ("e" in v) or ("E" in v) else v + ".0")
-                ),
-            ),
-            "edit_%": dict(
-                set=lambda v: f"{v * 1e2:.6g}",
-                # get = lambda v: float(v) * 1e-2,
-                get=lambda v: YAML_OBJ.load(v + "e-2" if float(v) != 0.0 else "0.0"),
-            ),
-            "edit_str": dict(set=lambda v: str(v), get=lambda v: v),
-            "edit_str_None": dict(
-                set=lambda v: str(v) if v is not None else "",
-                get=lambda v: v if v.strip() != "" else None,
-            ),
-            "check": dict(set=lambda v: v, get=lambda v: v),
-            "combo": dict(set=lambda v: v, get=lambda v: v),
-            "edit_list_int": dict(
-                set=lambda v_list: ", ".join([f"{v:d}" for v in v_list]),
-                get=lambda v: [int(s) for s in v.split(",")],
-            ),
-            "edit_list_float": dict(
-                set=lambda v_list: ", ".join([f"{v:.6g}" for v in v_list]),
-                get=lambda v: [float(s.strip()) for s in v.split(",")],
-            ),
-            "combo_special": dict(
-                set=self._set_combo_special, get=self._get_combo_special
-            ),
-            "edit_special": dict(
-                set=self._set_edit_special, get=self._get_edit_special
-            ),
-        }
+        # Per-instance view of the shared converter table; only the two
+        # "*_special" entries bind this instance.
+        self.converters = {k: dict(v) for k, v in _STATIC_CONVERTERS.items()}
+        self.converters["combo_special"] = dict(
+            set=self._set_combo_special, get=self._get_combo_special
+        )
+        self.converters["edit_special"] = dict(
+            set=self._set_edit_special, get=self._get_edit_special
+        )
 
     @staticmethod
     def _get_edit_special(name, v):
@@ -949,12 +977,12 @@ class PageGenReport(PageStandard):
                 iter(v[0])
             except TypeError:
                 v_list = v
-                return ", ".join([f"{v/1e6:.6g}" for v in v_list])
+                return ", ".join([_fmt6g(v / 1e6) for v in v_list])
             else:
                 v_LoL = v
                 list_strs = []
                 for v_list in v_LoL:
-                    list_s = "[{}]".format(", ".join([f"{v/1e6:.6g}" for v in v_list]))
+                    list_s = "[{}]".format(", ".join([_fmt6g(v / 1e6) for v in v_list]))
                     list_strs.append(list_s)
                 return ", ".join(list_strs)
         else:
@@ -984,7 +1012,7 @@ class PageGenReport(PageStandard):
             elif v in ("Auto", "auto"):
                 return v
             else:
-                return f"{v:.6g}"
+                return _fmt6g(v)
         else:
             raise ValueError()
 
@@ -1089,6 +1117,10 @@ class PageGenReport(PageStandard):
 
         new_qos_names = list(SLURM_MAX_TIME_LIMITS[current_partition])
 
+        # clear()/insertItems() fire currentTextChanged for every intermediate
+        # state, re-running the time-limit tooltip updater per insertion;
+        # rebuild with signals blocked and notify once with the final text.
+        blocker = QtCore.QSignalBlocker(qos_combo)
         qos_combo.clear()
         qos_combo.insertItems(0, new_qos_names)
 
@@ -1098,6 +1130,8 @@ class PageGenReport(PageStandard):
             i = 0
 
         qos_combo.setCurrentIndex(i)
+        del blocker
+        qos_combo.currentTextChanged.emit(qos_combo.currentText())
 
     def _update_time_limit_tooltip(self, current_qos, sender=None):
         """"""
@@ -1209,8 +1243,7 @@ class GlobalOptionsDialog(QtWidgets.QDialog):
         """Constructor"""
 
         super().__init__(*args, **kwargs)
-        ui_file = os.path.join(os.path.dirname(__file__), "global_options.ui")
-        uic.loadUi(ui_file, self)
+        _setup_cached_ui(self, "global_options.ui")
 
         self.conf = conf
 
@@ -5060,12 +5093,20 @@ class PageNonlinProduction(PageGenReport):
             QtWidgets.QComboBox,
         )
 
+        # calc_type -> widget / field-name lookup tables, built once so the
+        # hot checkbox handlers and field sync loops below avoid per-call
+        # f-string construction and widget lookups
         self._checkboxes = {}
+        self._check_field_names = {}
         for opt_type in ["include", "recalc", "replot"]:
+            cb_by_calc_type = self._checkboxes[opt_type] = {}
+            name_by_calc_type = self._check_field_names[opt_type] = {}
             for calc_type in ["all"] + self.all_calc_types:
                 w = self.safeFindChild(check, f"checkBox_nonlin_{opt_type}_{calc_type}")
-                self._checkboxes[f"{opt_type}:{calc_type}"] = w
-                self.registerFieldOnFirstShow(f"check_{opt_type}_{calc_type}", w)
+                cb_by_calc_type[calc_type] = w
+                field_name = f"check_{opt_type}_{calc_type}"
+                name_by_calc_type[calc_type] = field_name
+                self.registerFieldOnFirstShow(field_name, w)
 
         self.setter_getter = {
             "cmap_xy": dict(cmin="spin", cmax="spin"),
@@ -5088,25 +5129,29 @@ class PageNonlinProduction(PageGenReport):
 
         self.establish_connections()  # "Run Production" & "Open PDF" buttons
 
+        # Bind the handlers once; connecting lambdas with default args avoids
+        # rebuilding a bound-method object per connection in the loops below.
+        change_all = self.change_all_nonlin_calc_type_checkbox_states
+        uncheck_all = self.uncheck_all
         for opt_type in ["include", "recalc", "replot"]:
-            obj = self._checkboxes[f"{opt_type}:all"]
+            obj = self._checkboxes[opt_type]["all"]
             obj.clicked.connect(
-                partial(self.change_all_nonlin_calc_type_checkbox_states, opt_type)
+                lambda checked, ot=opt_type: change_all(ot, checked)
             )
 
         for calc_type in self.all_calc_types:
-            obj = self._checkboxes[f"include:{calc_type}"]
-            obj.clicked.connect(partial(self.uncheck_all, "include"))
+            obj = self._checkboxes["include"][calc_type]
+            obj.clicked.connect(lambda checked: uncheck_all("include", checked))
             # obj.stateChanged.connect(partial(
             # self.change_state_recalc_replot_checkboxes, calc_type))
 
-            obj = self._checkboxes[f"recalc:{calc_type}"]
-            obj.clicked.connect(partial(self.uncheck_all, "recalc"))
+            obj = self._checkboxes["recalc"][calc_type]
+            obj.clicked.connect(lambda checked: uncheck_all("recalc", checked))
             # obj.stateChanged.connect(partial(
             # self.change_state_replot_checkboxes, calc_type))
 
-            obj = self._checkboxes[f"replot:{calc_type}"]
-            obj.clicked.connect(partial(self.uncheck_all, "replot"))
+            obj = self._checkboxes["replot"][calc_type]
+            obj.clicked.connect(lambda checked: uncheck_all("replot", checked))
 
         self._pageInitialized = True
 
@@ -5117,12 +5162,13 @@ class PageNonlinProduction(PageGenReport):
 
         for opt_type in ["include", "recalc", "replot"]:
             all_true = True
+            field_names = self._check_field_names[opt_type]
             for calc_type in self.all_calc_types:
                 v = ncf[opt_type][calc_type]
-                self.setField(f"check_{opt_type}_{calc_type}", v)
+                self.setField(field_names[calc_type], v)
                 if not v:
                     all_true = False
-            self._checkboxes[f"{opt_type}:all"].setChecked(all_true)
+            self._checkboxes[opt_type]["all"].setChecked(all_true)
 
         for calc_type in ["cmap_xy", "cmap_px"]:
             if f"{calc_type}_plot_opts" in ncf:
@@ -5136,28 +5182,25 @@ class PageNonlinProduction(PageGenReport):
     def change_all_nonlin_calc_type_checkbox_states(self, opt_type, checked):
         """"""
 
+        cb_by_calc_type = self._checkboxes[opt_type]
         for calc_type in self.all_calc_types:
-            obj = self._checkboxes[f"{opt_type}:{calc_type}"]
-            obj.setChecked(checked)
+            cb_by_calc_type[calc_type].setChecked(checked)
 
     def uncheck_all(self, opt_type, checked):
         """"""
         if not checked:
-            self._checkboxes[f"{opt_type}:all"].setChecked(False)
+            self._checkboxes[opt_type]["all"].setChecked(False)
 
     def change_state_recalc_replot_checkboxes(self, calc_type, include_checked):
         """"""
 
-        obj = self._checkboxes[f"recalc:{calc_type}"]
-        obj.setEnabled(include_checked)
-        obj = self._checkboxes[f"replot:{calc_type}"]
-        obj.setEnabled(include_checked)
+        self._checkboxes["recalc"][calc_type].setEnabled(include_checked)
+        self._checkboxes["replot"][calc_type].setEnabled(include_checked)
 
     def change_state_replot_checkboxes(self, calc_type, recalc_checked):
         """"""
 
-        obj = self._checkboxes[f"replot:{calc_type}"]
-        obj.setEnabled(recalc_checked)
+        self._checkboxes["replot"][calc_type].setEnabled(recalc_checked)
 
     def validatePage(self):
         """"""
@@ -5189,9 +5232,9 @@ class PageNonlinProduction(PageGenReport):
         ncf = mod_conf["nonlin"]
 
         for opt_type in ["include", "recalc", "replot"]:
+            field_names = self._check_field_names[opt_type]
             for calc_type in self.all_calc_types:
-                v = self.field(f"check_{opt_type}_{calc_type}")
-                ncf[opt_type][calc_type] = v
+                ncf[opt_type][calc_type] = self.field(field_names[calc_type])
 
         # TODO
         if "driving_terms" in ncf["include"]:
@@ -5370,6 +5413,10 @@ class PageRfTau(PageGenReport):
     def pre_scan_V_tau(self):
         """"""
 
+        # Deferred: pulling in matplotlib at module import adds seconds to
+        # wizard startup, and only this lifetime-scan plot needs it.
+        import matplotlib.pyplot as plt
+
         spin, edit, check, combo = (
             QtWidgets.QSpinBox,
             QtWidgets.QLineEdit,
@@ -5985,11 +6032,23 @@ class PageRfTau(PageGenReport):
 
         return super().eventFilter(widget, event)
 
+    def _bulk_set_enabled(self, widgets, enabled):
+        """
+        Toggle many widgets with repaints suspended, so the whole batch
+        costs a single relayout/repaint pass instead of one per widget.
+        """
+
+        self.setUpdatesEnabled(False)
+        try:
+            for w in widgets:
+                w.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
+
     def enable_special_opts(self, widget_list, enabled):
         """"""
 
-        for w in widget_list:
-            w.setEnabled(enabled)
+        self._bulk_set_enabled(widget_list, enabled)
 
     def enable_opts(self, k_wtype_list, enabled):
         """"""
@@ -6001,6 +6060,7 @@ class PageRfTau(PageGenReport):
             QtWidgets.QComboBox,
         )
 
+        widgets = []
         for k, wtype in k_wtype_list:
 
             if k.endswith("_include"):
@@ -6018,7 +6078,9 @@ class PageRfTau(PageGenReport):
             else:
                 raise ValueError()
 
-            w.setEnabled(enabled)
+            widgets.append(w)
+
+        self._bulk_set_enabled(widgets, enabled)
 
     def validatePage(self):
         """"""
@@ -6246,10 +6308,7 @@ class TotalBeamCurrentEditor(QtWidgets.QDialog):
         """Constructor"""
 
         super().__init__(*args, **kwargs)
-        ui_file = os.path.join(
-            os.path.dirname(__file__), "total_beam_current_editor.ui"
-        )
-        uic.loadUi(ui_file, self)
+        _setup_cached_ui(self, "total_beam_current_editor.ui")
 
         self.data = data
 
@@ -6294,10 +6353,7 @@ class LossPlotsSetEditor(QtWidgets.QDialog):
         """Constructor"""
 
         super().__init__(*args, **kwargs)
-        ui_file = os.path.join(
-            os.path.dirname(__file__), "total_beam_current_editor.ui"
-        )
-        uic.loadUi(ui_file, self)
+        _setup_cached_ui(self, "total_beam_current_editor.ui")
 
         self.setWindowTitle("Index Set for Loss Plots")
         self.label.setText("Check sets for which you want loss plots:")
@@ -1,3 +1,4 @@
+from functools import lru_cache
 import os
 import sys
 
@@ -5,6 +6,29 @@ from qtpy import QtCore, QtGui, QtWidgets, uic
 from ruamel.yaml.comments import CommentedMap
 
 
+@lru_cache(maxsize=None)
+def _get_cached_ui_class(ui_filename):
+    """
+    Return the generated form class for a ``.ui`` file in this folder.
+
+    ``uic.loadUi()`` re-parses the XML and regenerates the form code every
+    time a dialog is opened; ``uic.loadUiType()`` does that work once per
+    file and the cache makes every later open a plain class instantiation.
+    """
+    ui_file = os.path.join(os.path.dirname(__file__), ui_filename)
+    form_class, _ = uic.loadUiType(ui_file)
+    return form_class
+
+
+def _setup_cached_ui(widget, ui_filename):
+    """Drop-in replacement for ``uic.loadUi()`` using the cached form class."""
+    ui = _get_cached_ui_class(ui_filename)()
+    ui.setupUi(widget)
+    # loadUi() used to bind the child widgets directly onto the widget
+    for name, child in vars(ui).items():
+        setattr(widget, name, child)
+
+
 class SkipPageListModel(QtCore.QAbstractListModel):
     """"""
 
@@ -32,8 +56,7 @@ class SkipPageSelector(QtWidgets.QDialog):
         """Constructor"""
 
         super().__init__(*args, **kwargs)
-        ui_file = os.path.join(os.path.dirname(__file__), "skip_page.ui")
-        uic.loadUi(ui_file, self)
+        _setup_cached_ui(self, "skip_page.ui")
 
         w = wizard_obj
         if isinstance(w, ReportWizard):
@@ -71,8 +94,7 @@ class SkipPageSelector(QtWidgets.QDialog):
 class ReportWizard(QtWidgets.QWizard):
     def __init__(self):
         super().__init__()
-        ui_file = os.path.join(os.path.dirname(__file__), "wizard.ui")
-        uic.loadUi(ui_file, self)
+        _setup_cached_ui(self, "wizard.ui")
 
         self.config_filepath = None
         self.pdf_filepath = None
@@ -1,6 +1,8 @@
 import importlib
 import os
 
+_PARALLEL_DEPS = frozenset({"mpi4py", "dill", "qtpy"})
+
 remote_name = os.environ.get("PYELEGANT_REMOTE", "")
 
 if remote_name != "":
@@ -9,9 +11,14 @@ if remote_name != "":
     except ImportError as e:
         remote = None
         import_error = str(e)
+        # ModuleNotFoundError carries the missing module's name directly;
+        # classifying on it is locale-independent, unlike scanning the
+        # exception message, and also catches nested submodule failures.
+        missing_dep = getattr(e, "name", None)
 else:
     remote = None
     import_error = None
+    missing_dep = None
 
 if remote is None:
     print("\n## pyelegant:WARNING ##")
@@ -19,8 +26,9 @@ if remote is None:
         print(
             "$PYELEGANT_REMOTE not set. All ELEGANT commands will only be run locally."
         )
-    elif import_error and any(
-        dep in import_error for dep in ["mpi4py", "dill", "qtpy"]
+    elif import_error and (
+        missing_dep in _PARALLEL_DEPS
+        or (missing_dep or "").partition(".")[0] in _PARALLEL_DEPS
     ):
         print(f"Cannot load remote module '{remote_name}': {import_error}")
         print(
@@ -6,6 +6,10 @@ from typing import Dict, Iterable, Optional, Union
 
 import numpy as np
 
+# Factorials up to the largest order CSBEND could meaningfully take; built
+# once at import so each conversion call just slices it.
+_FACT = np.array([factorial(i) for i in range(33)], dtype=np.float64)
+
 
 def sysmult_to_csbend_K(
     order: Union[Iterable[int], np.ndarray],
@@ -54,43 +58,54 @@ def sysmult_to_csbend_K(
     if angle == 0:
         raise ValueError("angle must be nonzero (rho = L/angle).")
 
+    out_kind = output.lower()
+    if out_kind not in ("k", "b"):
+        raise ValueError('output must be "K" or "b".')
+    is_k = out_kind == "k"
+
     rho = L / angle
     R = reference_radius
 
-    order_arr = np.asarray(list(order), dtype=int)
-    normal_arr = np.asarray(list(normal), dtype=float)
+    # np.asarray is zero-copy when the caller already passes an ndarray of
+    # the right dtype (as sysmult_sdds_dict_to_csbend_K does)
+    order_arr = np.asarray(order, dtype=np.int64)
+    normal_arr = np.asarray(normal, dtype=np.float64)
     if order_arr.shape != normal_arr.shape:
         raise ValueError("order and normal must have the same length.")
 
     skew_arr = None
     if skew is not None:
-        skew_arr = np.asarray(list(skew), dtype=float)
+        skew_arr = np.asarray(skew, dtype=np.float64)
         if skew_arr.shape != order_arr.shape:
             raise ValueError("skew must have the same length as order/normal.")
 
     out: Dict[str, float] = {}
 
+    fact = _FACT[: max_order + 1]
+    # small lookup tables indexed by n: R**n recomputed per element would be
+    # one libm pow call each; a gather into this table is much cheaper
+    R_pow = R ** np.arange(max_order + 1)
+    inv_rho = 1.0 / rho
+    mask = (order_arr >= 1) & (order_arr <= max_order)
+    valid_ns = order_arr[mask]
+    valid_n_strs = [str(n) for n in valid_ns.tolist()]
+
     def emit(values: np.ndarray, prefix: str) -> None:
-        for n, a_n in zip(order_arr, values):
-            if not (1 <= n <= max_order):
-                continue
-            # b_n in By/B0 expansion
-            b_n = float(a_n) * factorial(int(n)) / (R ** int(n))
-            if output.lower() == "b":
-                out[f"{prefix}{n}"] = b_n
-            elif output.lower() == "k":
-                out[f"{prefix}{n}"] = b_n / rho
-            else:
-                raise ValueError('output must be "K" or "b".')
-
-    if output.lower() == "b":
-        emit(normal_arr, "b")
-        if skew_arr is not None:
-            emit(skew_arr, "bs")
-    else:
+        # b_n in By/B0 expansion, computed for all valid orders at once
+        b = values[mask] * fact[valid_ns] / R_pow[valid_ns]
+        if is_k:
+            b = b * inv_rho
+        # single C-level bulk insertion instead of one dict write per key
+        out.update(zip((prefix + s for s in valid_n_strs), b.tolist()))
+
+    if is_k:
         emit(normal_arr, "K")
         if skew_arr is not None:
             emit(skew_arr, "KS")
+    else:
+        emit(normal_arr, "b")
+        if skew_arr is not None:
+            emit(skew_arr, "bs")
 
     return out
 
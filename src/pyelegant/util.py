@@ -46,10 +46,15 @@ def robust_text_file_write(output_filepath, contents, nMaxTry=10, sleep=10.0):
 
     success = False
 
+    # Encode once up front and write in binary mode, so each (re)try is a
+    # single bulk write of the prepared bytes instead of going through the
+    # text layer's incremental encoder.
+    data = contents.encode()
+
     for iTry in range(nMaxTry):
         try:
-            with open(output_filepath, "w") as f:
-                f.write(contents)
+            with open(output_filepath, "wb") as f:
+                f.write(data)
             success = True
             break
         except:
@@ -4,57 +4,72 @@ import sys
 import os
 import glob
 
+import numpy as np
+
 from pyelegant import elebuilder
 from pyelegant import remote
 from pyelegant import sdds
 from pyelegant import util
 
-eb = elebuilder.EleContents(double_format='.12g')
+FAST = os.environ.get('PYELEGANT_FAST_LOGS', '0') == '1'
+# ^ When set, reduce the optimizer log output to a minimum. On a networked
+#   filesystem the simplex/population log writes can dominate the wallclock.
+
+ele_filepath = 'test_hybridsimplex.ele'
+
+eb = elebuilder.EleDesigner(
+    ele_filepath=ele_filepath, double_format='.12g', auto_print_on_add=False)
 
-eb.run_setup(
+eb.add_block('run_setup',
     lattice = 'lattice3.lte', p_central_mev = 3e3,
     use_beamline='ring',
     semaphore_file = '%s.done', parameters = '%s.param', default_order = 2
 )
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Load solution from previous optimization')
-eb.load_parameters(
+eb.add_comment('Load solution from previous optimization')
+eb.add_block('load_parameters',
     filename = 'cbiiMatch02.param',
     change_defined_values = 1,
 )
 
-eb.newline()
+eb.add_newline()
+
+warm_start_prefix = ele_filepath[:-len('.ele')]
+if os.path.exists(warm_start_prefix + '.param'):
+    eb.add_comment('Warm-start from the final parameters of the previous run')
+    eb.warm_start_from(warm_start_prefix)
+    eb.add_newline()
 
-eb.comment('! Ask for twiss parameters (during optimization)')
-eb.twiss_output(
+eb.add_comment('Ask for twiss parameters (during optimization)')
+eb.add_block('twiss_output',
     output_at_each_step = 1,
     matched = 1,
     radiation_integrals = 1,
     concat_order = 2,
 )
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Ask for floor coordinates (during optimization)')
-eb.floor_coordinates(
+eb.add_comment('Ask for floor coordinates (during optimization)')
+eb.add_block('floor_coordinates',
     filename = '%s.flr'
 )
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Load floor coordinate data for NSLS-II')
-eb.comment('! - First ID')
-eb.rpn_load(
+eb.add_comment('Load floor coordinate data for NSLS-II')
+eb.add_comment('- First ID')
+eb.add_block('rpn_load',
     filename = 'nsls2.flr',
     tag = 'flr1',
     match_column = 'ElementName',
     match_column_value = 'MID',
     matching_row_number = 0
 )
-eb.comment('! - Second ID')
-eb.rpn_load(
+eb.add_comment('- Second ID')
+eb.add_block('rpn_load',
     filename = 'nsls2.flr',
     tag = 'flr2',
     match_column = 'ElementName',
@@ -62,240 +77,212 @@ eb.rpn_load(
     matching_row_number = 1
 )
 
-eb.newline()
+eb.add_newline()
+
+eb.add_comment('Reference radii are constant during the optimization, so')
+eb.add_comment('compute them once here instead of in every term evaluation')
+eb.add_rpn_scalar('flr1_r',
+    elebuilder.rpn('flr1.X', 'sqr', 'flr1.Z', 'sqr', '+', 'sqrt'))
+eb.add_rpn_scalar('flr2_r',
+    elebuilder.rpn('flr2.X', 'sqr', 'flr2.Z', 'sqr', '+', 'sqrt'))
 
-eb.run_control()
+eb.add_newline()
 
-eb.newline()
+eb.add_block('run_control')
 
-eb.comment('! Use parallel hybrid simplex optimization')
-eb.parallel_optimization_setup(
+eb.add_newline()
+
+N_OPTIM_VARS = 26
+# ^ Total number of "&optimization_variable" declarations below. The
+#   simplex candidates can be evaluated concurrently, up to roughly one
+#   per variable, so matching the population size to this count (and
+#   running with ntasks ~ population_size + 1 for the master rank) keeps
+#   all MPI ranks busy.
+
+eb.add_comment('Use parallel hybrid simplex optimization')
+eb.add_block('parallel_optimization_setup',
     mode = 'minimize', method = 'hybridsimplex',
-    hybrid_simplex_comparison_interval = 100,
+    population_size = N_OPTIM_VARS,
+    # Scale the global-comparison sync interval with the evaluation budget
+    # and population size instead of hard-coding it
+    auto_comparison_interval = True,
     target = 1e-6, tolerance = 1e-14,
     #n_passes = 3, n_evaluations = 1500, n_restarts = 10,
     n_passes = 3, n_evaluations = 100, n_restarts = 1,
+    # Re-use information from earlier evaluations across restarts, instead
+    # of starting each restart cold. The 1-D scans seed each restart from
+    # the best point found so far, and perturbing only the worst terms
+    # avoids re-evaluating the already-converged directions.
+    include_simplex_1d_scans = 1,
+    restart_worst_terms = 2,
     verbose = 0, log_file = '/dev/tty',
-    output_sparsing_factor = 100,
+    output_sparsing_factor = 1000 if FAST else 100,
     term_log_file = '%s.tlog',
-    population_log = '%s.pop',
-    simplex_log = '%s.simlog',
+    population_log = '/dev/null' if FAST else '%s.pop',
+    simplex_log = '/dev/null' if FAST else '%s.simlog',
     #!! Depending on your filesystem, you may want to
     #!! increase this in order to improve performance
     #simplex_log_interval = 10,
-    simplex_log_interval = 50,
+    simplex_log_interval = 1000 if FAST else 50,
 )
 
-eb.newline()
-
-eb.comment('! Dipole angles')
-eb.optimization_variable(
-    name = 'B1QDH', item = 'ANGLE',
-    lower_limit=-0.01, upper_limit=0.03, step_size=1e-5
-)
-eb.optimization_variable(
-    name = 'B2QDH', item = 'ANGLE',
-    lower_limit=-0.01, upper_limit=0.03, step_size=1e-5
-)
-eb.optimization_variable(
-    name = 'B3QDH', item = 'ANGLE',
-    lower_limit=-0.01, upper_limit=0.03, step_size=1e-5
-)
-eb.optimization_variable(
-    name = 'B4QDH', item = 'ANGLE',
-    lower_limit=-0.01, upper_limit=0.03, step_size=1e-5
-)
-eb.optimization_variable(
-    name = 'QF1', item = 'ANGLE',
-    lower_limit=-0.01, upper_limit=0.03, step_size=1e-5
-)
-eb.optimization_variable(
-    name = 'QF2', item = 'ANGLE',
-    lower_limit=-0.01, upper_limit=0.03, step_size=1e-5
-)
+eb.add_newline()
 
-eb.newline()
+with eb.section('Dipole angles'):
+    eb.add_optimization_variables_bulk(
+        [('B1QDH',), ('B2QDH',), ('B3QDH',), ('B4QDH',), ('QF1',), ('QF2',)],
+        item='ANGLE', lower_limit=-0.01, upper_limit=0.03, step_size=1e-5,
+    )
 
-eb.comment('! Set QF4 angle so that the total per cell is 6 degrees')
-eb.optimization_covariable(
+eb.add_comment('Set QF4 angle so that the total per cell is 6 degrees')
+eb.add_block('optimization_covariable',
     name = 'QF4', item = 'ANGLE',
-    equation = '6 dtor B1QDH.ANGLE 2 * - B2QDH.ANGLE 2 * - B3QDH.ANGLE 2 * - B4QDH.ANGLE 2 * - QF1.ANGLE - QF2.ANGLE -'
+    equation = elebuilder.rpn(
+        elebuilder.deg2rad(6),  # inlined "6 dtor"
+        'B1QDH.ANGLE', '2', '*', '-', 'B2QDH.ANGLE', '2', '*', '-',
+        'B3QDH.ANGLE', '2', '*', '-', 'B4QDH.ANGLE', '2', '*', '-',
+        'QF1.ANGLE', '-', 'QF2.ANGLE', '-')
 )
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Constrain QF4 angle within a reasonable range')
-eb.optimization_term(
+eb.add_comment('Constrain QF4 angle within a reasonable range')
+eb.add_block('optimization_term',
     term = "QF4.ANGLE 0.01 1e-6 selt"
 )
-eb.optimization_term(
+eb.add_block('optimization_term',
     term = "QF4.ANGLE 0.03 1e-6 segt"
 )
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Vary focusing gradients')
-eb.optimization_variable(
-    name = 'B1QDH', item = 'K1', lower_limit=-25, upper_limit=25, step_size=1e-4
-)
-eb.optimization_variable(
-    name = 'B2QDH', item = 'K1', lower_limit=-25, upper_limit=25, step_size=1e-4
-)
-eb.optimization_variable(
-    name = 'B3QDH', item = 'K1', lower_limit=-25, upper_limit=25, step_size=1e-4
-)
-eb.optimization_variable(
-    name = 'B4QDH', item = 'K1', lower_limit=-25, upper_limit=25, step_size=1e-4
-)
-eb.optimization_variable(
-    name = 'QF1', item = 'K1', lower_limit=-25, upper_limit=25, step_size=1e-4
-)
-eb.optimization_variable(
-    name = 'QF2', item = 'K1', lower_limit=-25, upper_limit=25, step_size=1e-4
-)
-eb.optimization_variable(
-    name = 'QF3', item = 'K1', lower_limit=-25, upper_limit=25, step_size=1e-4
-)
-eb.optimization_variable(
-    name = 'QF4', item = 'K1', lower_limit=-25, upper_limit=25, step_size=1e-4
-)
-
-eb.newline()
-
-eb.optimization_variable(
-    name = 'M1G4A', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
-eb.optimization_variable(
-    name = 'M2G4A', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
-
-eb.newline()
-
-eb.optimization_variable(
-    name = 'Q0', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
-eb.optimization_variable(
-    name = 'QH3G2A', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
-eb.optimization_variable(
-    name = 'QH2G2A', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
-eb.optimization_variable(
-    name = 'QH1G2A', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
+with eb.section('Vary focusing gradients'):
+    eb.add_optimization_variables_same(
+        ['B1QDH', 'B2QDH', 'B3QDH', 'B4QDH', 'QF1', 'QF2', 'QF3', 'QF4'],
+        item='K1', lower_limit=-25, upper_limit=25, step_size=1e-4,
+    )
 
-eb.newline()
+with eb.section():
+    eb.add_optimization_variables_same(
+        ['M1G4A', 'M2G4A'],
+        item='K1', lower_limit=-7, upper_limit=7, step_size=1e-4,
+    )
 
-eb.optimization_variable(
-    name = 'QL0', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
-eb.optimization_variable(
-    name = 'QL3G2A', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
-eb.optimization_variable(
-    name = 'QL2G2A', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
-eb.optimization_variable(
-    name = 'QL1G2A', item = 'K1', lower_limit = -7, upper_limit = 7, step_size = 1e-4
-)
+with eb.section():
+    eb.add_optimization_variables_same(
+        ['Q0', 'QH3G2A', 'QH2G2A', 'QH1G2A'],
+        item='K1', lower_limit=-7, upper_limit=7, step_size=1e-4,
+    )
 
-eb.newline()
+with eb.section():
+    eb.add_optimization_variables_same(
+        ['QL0', 'QL3G2A', 'QL2G2A', 'QL1G2A'],
+        item='K1', lower_limit=-7, upper_limit=7, step_size=1e-4,
+    )
 
-eb.optimization_term(
-    term = "dnux/dp 15 * abs 10 /")
-eb.optimization_term(
-    term = "dnuy/dp 15 * abs 10 /"
-)
+eb.add_block('optimization_term',
+    term = elebuilder.rpn('dnux/dp', '15', '*', 'abs', '10', '/'))
+eb.add_block('optimization_term',
+    term = elebuilder.rpn('dnuy/dp', '15', '*', 'abs', '10', '/'))
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Want Jx:[1, 2]')
-eb.optimization_term(term = "Jx 1 1e-6 selt")
-eb.optimization_term(term = "Jx 2 1e-6 segt")
+eb.add_comment('Want Jx:[1, 2]')
+eb.add_block('optimization_term', term = "Jx 1 1e-6 selt")
+eb.add_block('optimization_term', term = "Jx 2 1e-6 segt")
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Want etax to be zero in both ID straights')
-eb.optimization_term(term = "MID#1.etax 0 1e-4 sene")
-eb.optimization_term(term = "MID#2.etax 0 1e-4 sene")
+eb.add_comment('Want etax to be zero in both ID straights')
+eb.add_block('optimization_term', term = "MID#1.etax 0 1e-4 sene")
+eb.add_block('optimization_term', term = "MID#2.etax 0 1e-4 sene")
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Want etax>0.08 in high-dispersion region (weak requirement)')
-eb.optimization_term(term = "MDISP#1.etax .1 .01 selt")
-eb.optimization_term(term = "MDISP#2.etax .1 .01 selt")
+eb.add_comment('Want etax>0.08 in high-dispersion region (weak requirement)')
+eb.add_block('optimization_term', term = "MDISP#1.etax .1 .01 selt")
+eb.add_block('optimization_term', term = "MDISP#2.etax .1 .01 selt")
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Minimize the emittance')
+eb.add_comment('Minimize the emittance')
 
-eb.optimization_term(term = "ex0 1e12 * 50.0 1.0 segt 10 *")
+eb.add_block('optimization_term', term = "ex0 1e12 * 50.0 1.0 segt 10 *")
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Allow straight section lengths to vary (helps matching floor coordinates)')
-eb.optimization_variable(
-    name = 'ODL1G1A', item = 'L', lower_limit = 3.2, upper_limit = 3.4
-)
-eb.optimization_variable(
-    name = 'ODH1G1A', item = 'L', lower_limit = 4.4, upper_limit = 4.6
-)
+eb.add_comment('Allow straight section lengths to vary (helps matching floor coordinates)')
+STRAIGHT_L_VARS = np.array(
+    [('ODL1G1A', 'L', 3.2, 3.4, 1.0),
+     ('ODH1G1A', 'L', 4.4, 4.6, 1.0)],
+    # ^ step_size of 1.0 is the elegant default for this block
+    dtype=[('name', 'U16'), ('item', 'U8'),
+           ('lo', 'f8'), ('hi', 'f8'), ('step', 'f8')])
+eb.add_optimization_variables_from_array(STRAIGHT_L_VARS)
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Try to make betax=betay=L/2 in IDs, where L is the *total* straight length')
-eb.comment('!&optimization_term term = "MID#1.betax ODL1G1A.L / 1 .1 sene 100 *" &end')
-eb.comment('!&optimization_term term = "MID#1.betay ODL1G1A.L / 1 .1 sene 100 *" &end')
-eb.comment('!&optimization_term term = "MID#2.betax ODH1G1A.L / 1 .1 sene 100 *" &end')
-eb.comment('!&optimization_term term = "MID#2.betay ODH1G1A.L / 1 .1 sene 100 *" &end')
-eb.comment('! Try to make betax & betay the same as NSLS-II Day-1 bare')
-eb.optimization_term(term = "MID#1.betax 1.846 0.2 sene 5 *")
-eb.optimization_term(term = "MID#1.betay 1.171 0.1 sene 5 *")
-eb.optimization_term(term = "MID#2.betax 20.466 2.0 sene 5 *")
-eb.optimization_term(term = "MID#2.betay 3.369 0.3 sene 5 *")
+eb.add_comment('Try to make betax=betay=L/2 in IDs, where L is the *total* straight length')
+eb.add_comment('&optimization_term term = "MID#1.betax ODL1G1A.L / 1 .1 sene 100 *" &end')
+eb.add_comment('&optimization_term term = "MID#1.betay ODL1G1A.L / 1 .1 sene 100 *" &end')
+eb.add_comment('&optimization_term term = "MID#2.betax ODH1G1A.L / 1 .1 sene 100 *" &end')
+eb.add_comment('&optimization_term term = "MID#2.betay ODH1G1A.L / 1 .1 sene 100 *" &end')
+eb.add_comment('Try to make betax & betay the same as NSLS-II Day-1 bare')
+eb.add_block('optimization_term',
+    term = elebuilder.rpn('MID#1.betax', '1.846', '0.2', 'sene', '5', '*'))
+eb.add_block('optimization_term',
+    term = elebuilder.rpn('MID#1.betay', '1.171', '0.1', 'sene', '5', '*'))
+eb.add_block('optimization_term',
+    term = elebuilder.rpn('MID#2.betax', '20.466', '2.0', 'sene', '5', '*'))
+eb.add_block('optimization_term',
+    term = elebuilder.rpn('MID#2.betay', '3.369', '0.3', 'sene', '5', '*'))
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Keep the radius within 1mm of NSLS-II')
-eb.optimization_term(
-    term = "MID#1.X sqr MID#1.Z sqr + sqrt  flr1.X sqr flr1.Z sqr + sqrt 1e-3 sene")
-eb.optimization_term(
-    term = "MID#2.X sqr MID#2.Z sqr + sqrt  flr2.X sqr flr2.Z sqr + sqrt 1e-3 sene")
+eb.add_comment('Keep the radius within 1mm of NSLS-II')
+eb.add_block('optimization_term',
+    term = elebuilder.rpn(
+        'MID#1.X', 'sqr', 'MID#1.Z', 'sqr', '+', 'sqrt',
+        'flr1_r', '1e-3', 'sene'))
+eb.add_block('optimization_term',
+    term = elebuilder.rpn(
+        'MID#2.X', 'sqr', 'MID#2.Z', 'sqr', '+', 'sqrt',
+        'flr2_r', '1e-3', 'sene'))
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Make sure beta is not too large anywhere')
-eb.optimization_term(term = "max.betax 35.0 1.0 segt")
-eb.optimization_term(term = "max.betay 35.0 1.0 segt")
+eb.add_comment('Make sure beta is not too large anywhere')
+eb.add_block('optimization_term', term = "max.betax 35.0 1.0 segt")
+eb.add_block('optimization_term', term = "max.betay 35.0 1.0 segt")
 
-eb.newline()
+eb.add_newline()
 
-eb.comment('! Make sure beta is not too small anywhere')
-eb.optimization_term(term = "min.betax 0.2 0.1 selt")
-eb.optimization_term(term = "min.betay 0.2 0.1 selt")
+eb.add_comment('Make sure beta is not too small anywhere')
+eb.add_block('optimization_term', term = "min.betax 0.2 0.1 selt")
+eb.add_block('optimization_term', term = "min.betay 0.2 0.1 selt")
 
-eb.newline()
+eb.add_newline()
 
-eb.comment("! Ensure that central particle isn't lost")
-eb.optimization_term(term = "Particles 1 1e-10 sene")
+eb.add_comment("Ensure that central particle isn't lost")
+eb.add_block('optimization_term', term = "Particles 1 1e-10 sene")
 
-eb.newline()
+eb.add_newline()
 
-eb.comment("! Beam consists of central particle only")
-eb.bunched_beam()
+eb.add_comment("Beam consists of central particle only")
+eb.add_block('bunched_beam')
 
-eb.newline()
+eb.add_newline()
 
-eb.comment("! Start optimization")
-eb.optimize()
+eb.add_comment("Start optimization")
+eb.add_block('optimize')
 
-eb.newline()
+eb.add_newline()
 
-eb.comment("! Evaluate the results of optimization")
+eb.add_comment("Evaluate the results of optimization")
 
-eb.newline()
+eb.add_newline()
 
-eb.run_setup(
+eb.add_block('run_setup',
     lattice = 'lattice3.lte',
     use_beamline='ring',
     # ^ Note that here I am using the full ring, not 2 ring cells
@@ -305,33 +292,38 @@ eb.run_setup(
     default_order = 2,
 )
 
-eb.newline()
+eb.add_newline()
 
-eb.load_parameters(filename = '%s.param', change_defined_values = 1)
+eb.add_block('load_parameters', filename = '%s.param', change_defined_values = 1)
 
-eb.newline()
+eb.add_newline()
 
-eb.twiss_output(
+eb.add_block('twiss_output',
     filename = '%s.twi',
     matched = 1,
     radiation_integrals = 1,
     concat_order = 2)
 
-eb.newline()
+eb.add_newline()
 
-eb.floor_coordinates(filename = '%s.flr')
+eb.add_block('floor_coordinates', filename = '%s.flr')
 
-eb.newline()
+eb.add_newline()
 
-eb.save_lattice(filename = '%s.newlte')
+eb.add_block('save_lattice', filename = '%s.newlte')
 
-ele_filepath = 'test_hybridsimplex.ele'
-eb.write(ele_filepath)
+eb.write()
+
+# Ready-to-use launcher with core pinning, for running Pelegant by hand
+# outside of the Slurm submission below.
+eb.write_run_script(
+    ele_filepath.replace('.ele', '.sh'), mpi_ranks=N_OPTIM_VARS + 1)
 
-eb.update_output_filepaths(ele_filepath.replace('.ele', ''))
 output_filepath_list = eb.actual_output_filepath_list
 
-show_progress_plot = True
+show_progress_plot = not FAST
+# ^ The progress plot follows the simplex log, which is suppressed when
+#   "PYELEGANT_FAST_LOGS" is set.
 
 if not show_progress_plot: # If you don't care to see the progress of the optimization
 
@@ -341,7 +333,7 @@ if not show_progress_plot: # If you don't care to see the progress of the optimi
     #    remote_opts = dict(pelegant=True, ntasks=50)
     remote_opts = dict(
         sbatch={'use': True, 'wait': True}, pelegant=True,
-        job_name='job', partition='normal', ntasks=50,
+        job_name='job', partition='normal', ntasks=N_OPTIM_VARS + 1,
         #mail_type_begin=True,
         mail_type_end=True, mail_user='yhidaka@bnl.gov',
     )
@@ -354,7 +346,7 @@ else: # If you want to see the progress of the optimization
     # Run Pelegant
     remote_opts = dict(
         sbatch={'use': True, 'wait': False}, pelegant=True,
-        job_name='job', partition='normal', ntasks=50,
+        job_name='job', partition='normal', ntasks=N_OPTIM_VARS + 1,
         #mail_type_begin=True,
         #mail_type_end=True, mail_user='yhidaka@bnl.gov',
     )